@@ -1,9 +1,16 @@
 import argparse
+import os
 import random
-from enum import Enum, auto
-from typing import Dict, Iterable, List, Optional, Tuple
+from array import array
+from collections import deque
+from functools import partial
+from multiprocessing import Pool
+from types import SimpleNamespace
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
 from strategies import (
+    AGGRESSIVE,
+    PERFECT,
     AggressiveStrategy,
     ConservativeStrategy,
     Flip7ChaserStrategy,
@@ -12,73 +19,179 @@ from strategies import (
     Strategy,
 )
 
-class CardType(Enum):
-    NUMBER = auto()
-    ACTION = auto()
-    MODIFIER = auto()
+# Card types are plain ints so hot-path checks are small-int compares
+NUMBER, ACTION, MODIFIER = 0, 1, 2
+# Namespace view of the card types for callers that used the old CardType enum
+CardType = SimpleNamespace(NUMBER=NUMBER, ACTION=ACTION, MODIFIER=MODIFIER)
 
-class Card:
-    def __init__(self, name, card_type, value=0, count=1):
-        self.name = name
-        self.card_type = card_type
-        self.value = value
-        self.count = count # For deck generation
 
-    def __repr__(self):
-        return f"[{self.name}]"
+def _card_specs() -> List[Tuple[str, int, int, int]]:
+    """Return (name, type, value, count) rows describing the full deck."""
+
+    # Number Cards: One 0, One 1, Two 2s ... Twelve 12s [cite: 13, 14, 52]
+    specs = [("0", NUMBER, 0, 1)]
+    for i in range(1, 13):
+        specs.append((str(i), NUMBER, i, i))
+
+    # Action Cards [cite: 14, 34, 39]
+    # Counts are estimated based on visual "x3" cues in the document
+    specs.append(("Flip Three", ACTION, 0, 3))
+    specs.append(("Freeze", ACTION, 0, 3))
+    specs.append(("Second Chance", ACTION, 0, 3))
+
+    # Modifier Cards [cite: 40, 114, 118, 119]
+    # Estimated remaining counts to reach ~94 cards
+    specs.append(("+2 Points", MODIFIER, 2, 1))
+    specs.append(("+4 Points", MODIFIER, 4, 1))
+    specs.append(("+6 Points", MODIFIER, 6, 1))
+    specs.append(("+8 Points", MODIFIER, 8, 1))
+    specs.append(("+10 Points", MODIFIER, 10, 1))
+    specs.append(("x2 Multiplier", MODIFIER, 0, 1))
+    return specs
+
+
+# Each physical card is an int id indexing these parallel lookup tables
+_EXPANDED = [
+    (name, card_type, value, face)
+    for face, (name, card_type, value, count) in enumerate(_card_specs())
+    for _ in range(count)
+]
+CARD_NAME: Tuple[str, ...] = tuple(name for name, _, _, _ in _EXPANDED)
+CARD_TYPE = array("b", (card_type for _, card_type, _, _ in _EXPANDED))
+CARD_VALUE = array("b", (value for _, _, value, _ in _EXPANDED))
+# Copies of the same card share a face (their _card_specs row); FACE_CARD holds one id per face
+CARD_FACE = array("b", (face for _, _, _, face in _EXPANDED))
+FACE_CARD: Tuple[int, ...] = tuple(CARD_FACE.index(face) for face in range(CARD_FACE[-1] + 1))
+DECK_IDS: Tuple[int, ...] = tuple(range(len(_EXPANDED)))
+del _EXPANDED
+assert len(DECK_IDS) == 94, f"Deck should have 94 cards, found {len(DECK_IDS)}."
+
+FLIP_THREE_IDS = frozenset(i for i in DECK_IDS if CARD_NAME[i] == "Flip Three")
+FREEZE_IDS = frozenset(i for i in DECK_IDS if CARD_NAME[i] == "Freeze")
+SECOND_CHANCE_IDS = frozenset(i for i in DECK_IDS if CARD_NAME[i] == "Second Chance")
+X2_ID = CARD_NAME.index("x2 Multiplier")
+# Actions aimed at a player; drawn during Flip Three they resolve after the sequence
+_TARGETED_ACTION_IDS = FLIP_THREE_IDS | FREEZE_IDS
+
+
+def card_repr(card: int) -> str:
+    return f"[{CARD_NAME[card]}]"
+
+
+def format_cards(cards: Iterable[int]) -> str:
+    return "[" + ", ".join(card_repr(c) for c in cards) + "]"
+
+
+def score_hand(number_sum: int, modifier_sum: int, has_multiplier: bool, unique_count: int) -> int:
+    """Score a non-busted hand from its running totals."""
+
+    # Apply Multiplier First [cite: 122]
+    if has_multiplier:
+        number_sum *= 2
+
+    # Add Bonus Points [cite: 161]
+    total = number_sum + modifier_sum
+
+    # Check Flip 7 Bonus [cite: 170]
+    if unique_count >= 7:
+        total += 15
+
+    return total
+
+
+def _iter_bits(mask: int):
+    """Yield the index of each set bit in ``mask``, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
 
 class Deck:
-    def __init__(self, log=None):
+    __slots__ = ("draw_pile", "discard_pile", "log", "rng", "refills", "_tally_key", "_face_tally")
+
+    def __init__(self, log=None, rng: Optional[random.Random] = None):
         self.draw_pile = []
         self.discard_pile = []
-        self.log = log or (lambda *_, **__: None)
+        self.log = log # None keeps the deck silent
+        self.rng = rng or random.Random()
+        self.refills = 0 # Bumped whenever the draw pile grows
+        self._tally_key = None
+        self._face_tally = None
         self.build_deck()
 
     def build_deck(self):
-        # Number Cards: One 0, One 1, Two 2s ... Twelve 12s [cite: 13, 14, 52]
-        cards = [Card("0", CardType.NUMBER, 0, 1)]
-        for i in range(1, 13):
-            cards.append(Card(str(i), CardType.NUMBER, i, i))
-        
-        # Action Cards [cite: 14, 34, 39]
-        # Counts are estimated based on visual "x3" cues in the document
-        cards.append(Card("Flip Three", CardType.ACTION, 0, 3))
-        cards.append(Card("Freeze", CardType.ACTION, 0, 3))
-        cards.append(Card("Second Chance", CardType.ACTION, 0, 3))
-
-        # Modifier Cards [cite: 40, 114, 118, 119]
-        # Estimated remaining counts to reach ~94 cards
-        cards.append(Card("+2 Points", CardType.MODIFIER, 2, 1))
-        cards.append(Card("+4 Points", CardType.MODIFIER, 4, 1))
-        cards.append(Card("+6 Points", CardType.MODIFIER, 6, 1)) 
-        cards.append(Card("+8 Points", CardType.MODIFIER, 8, 1)) 
-        cards.append(Card("+10 Points", CardType.MODIFIER, 10, 1))
-        cards.append(Card("x2 Multiplier", CardType.MODIFIER, 0, 1))
-
-        final_deck = []
-        for c in cards:
-            for _ in range(c.count):
-                final_deck.append(Card(c.name, c.card_type, c.value))
-        
-        self.draw_pile = final_deck
-        assert len(self.draw_pile) == 94, f"Deck should have 94 cards, found {len(self.draw_pile)}."
-        self.shuffle()
-
-    def shuffle(self):
-        random.shuffle(self.draw_pile)
-        self.log("--- Deck Reshuffled ---")
+        # DECK_IDS is the immutable template; copying it is a single C-level list build
+        self.draw_pile = list(DECK_IDS)
+        self.refills += 1
+
+    def reset(self):
+        """Return every card to the draw pile, reusing both pile lists."""
+        self.draw_pile[:] = DECK_IDS
+        self.discard_pile.clear()
+        self.refills += 1
 
     def draw(self):
-        if not self.draw_pile:
+        draw_pile = self.draw_pile
+        n = len(draw_pile)
+        if not n:
             # Reshuffle discard into draw if empty [cite: 185]
-            self.draw_pile = self.discard_pile[:]
-            self.log(f"{len(self.draw_pile)} cards returned into draw pile")
-            self.discard_pile = []
-            self.shuffle()
-        
-        return self.draw_pile.pop()
+            # Refill in place so both piles keep their allocated capacity
+            draw_pile.extend(self.discard_pile)
+            self.discard_pile.clear()
+            self.refills += 1
+            n = len(draw_pile)
+            if self.log:
+                self.log(f"{n} cards returned into draw pile")
+                self.log("--- Deck Reshuffled ---")
+
+        # Pile order is never observed, so pick a random card instead of shuffling up front.
+        # random() is one C call, while randrange() runs several Python frames per draw.
+        j = int(self.rng.random() * n)
+        draw_pile[j], draw_pile[-1] = draw_pile[-1], draw_pile[j]
+        return draw_pile.pop()
+
+    def next_draw_pile(self) -> List[int]:
+        """Return the cards the next draw can come from."""
+        # An empty draw pile is refilled from the discard pile on the next draw
+        return self.draw_pile or self.discard_pile
+
+    def face_counts(self) -> List[int]:
+        """Return how many cards of each face the next draw can come from."""
+        pile = self.next_draw_pile()
+        # Between refills the draw pile only shrinks and the discard pile only grows,
+        # so (refills, pile, size) identifies the contents
+        key = (self.refills, pile is self.draw_pile, len(pile))
+        if key != self._tally_key:
+            counts = [0] * len(FACE_CARD)
+            for c in pile:
+                counts[CARD_FACE[c]] += 1
+            self._tally_key = key
+            self._face_tally = counts
+        return self._face_tally
 
 class Player:
+    __slots__ = (
+        "name",
+        "total_game_score",
+        "hand",
+        "active",
+        "busted",
+        "frozen",
+        "second_chance",
+        "second_chance_idx",
+        "forced_flips",
+        "pending_actions",
+        "number_mask",
+        "number_sum",
+        "modifier_sum",
+        "has_multiplier",
+        "unique_count",
+        "strategy",
+        "game",
+        "idx",
+    )
+
     def __init__(self, name: str, strategy: Optional[Strategy] = None):
         self.name = name
         self.total_game_score = 0
@@ -87,48 +200,45 @@ class Player:
         self.busted = False
         self.frozen = False
         self.second_chance = False
+        self.second_chance_idx = -1 # Position of the held Second Chance card in hand
         self.forced_flips = 0 # For 'Flip Three' action
-        self.pending_actions: List[Tuple[Card, Optional["Player"]]] = []
+        self.pending_actions: Deque[Tuple[int, Optional["Player"]]] = deque()
+        # Running hand totals, maintained by Game.deal_card_to_player
+        self.number_mask = 0 # Bit v set once number v is in hand
+        self.number_sum = 0
+        self.modifier_sum = 0
+        self.has_multiplier = False
+        self.unique_count = 0
         self.strategy = strategy or Flip7ChaserStrategy()
         self.game = None
+        self.idx = 0 # Seat index, also this player's bit in Game._active_mask
+
+    def set_active(self, active: bool):
+        """Set ``active`` and keep the owning game's active-player mask in sync."""
+        self.active = active
+        if self.game is not None:
+            if active:
+                self.game._active_mask |= 1 << self.idx
+            else:
+                self.game._active_mask &= ~(1 << self.idx)
 
     def reset_round(self):
-        self.hand = []
-        self.active = True
-        self.busted = False
-        self.frozen = False
-        self.second_chance = False
-        self.forced_flips = 0
-        self.pending_actions = []
+        self.hand.clear() # Reuse the list; its cards were already discarded
+        self.set_active(True)
+        self.busted = self.frozen = self.second_chance = self.has_multiplier = False
+        self.second_chance_idx = -1
+        self.forced_flips = self.number_mask = self.number_sum = self.modifier_sum = self.unique_count = 0
+        self.pending_actions.clear()
 
     def calculate_round_score(self):
         # [cite: 147-170]
         if self.busted:
             return 0
-        
-        number_sum = sum(c.value for c in self.hand if getattr(c.card_type, "name", None) == "NUMBER")
-        
-        # Apply Multiplier First [cite: 122]
-        has_multiplier = any(c.name == "x2 Multiplier" for c in self.hand)
-        if has_multiplier:
-            number_sum *= 2
-            
-        # Add Bonus Points [cite: 161]
-        modifier_sum = sum(c.value for c in self.hand if getattr(c.card_type, "name", None) == "MODIFIER" and c.name != "x2 Multiplier")
-        
-        total = number_sum + modifier_sum
-        
-        # Check Flip 7 Bonus [cite: 170]
-        unique_nums = {c.value for c in self.hand if getattr(c.card_type, "name", None) == "NUMBER"}
-        if len(unique_nums) >= 7:
-            total += 15
-            
-        return total
+        return score_hand(self.number_sum, self.modifier_sum, self.has_multiplier, self.unique_count)
 
     def has_flip_seven(self):
         # [cite: 9]
-        unique_nums = {c.value for c in self.hand if c.card_type == CardType.NUMBER}
-        return len(unique_nums) >= 7
+        return self.unique_count >= 7
 
     def decide_action(self, active_opponents: Iterable["Player"]):
         # Always hit if forced
@@ -138,33 +248,66 @@ class Player:
         return self.strategy.choose_action(self, active_opponents)
 
 class Game:
-    def __init__(self, player_names, strategies=None, verbose=True):
+    __slots__ = (
+        "players",
+        "verbose",
+        "rng",
+        "_active_mask",
+        "deck",
+        "dealer_index",
+        "round_num",
+        "winning_score",
+        "pending_flip7_winner",
+        "_leader",
+        "_max_score",
+    )
+
+    def __init__(self, player_names, strategies=None, verbose=True, seed: Optional[int] = None):
         self.players = []
         self.verbose = verbose
+        self.rng = random.Random(seed)
         for idx, name in enumerate(player_names):
             strategy = None
             if strategies and idx < len(strategies):
                 strategy = strategies[idx]
             player = Player(name, strategy=strategy)
             player.game = self
+            player.idx = idx
             self.players.append(player)
-        self.deck = Deck(log=self._log if verbose else None)
+        self._active_mask = (1 << len(self.players)) - 1 # Bit i set while players[i] is active
+        self.deck = Deck(log=self._log if verbose else None, rng=self.rng)
         self.dealer_index = 0
         self.round_num = 1
         self.winning_score = 200 # [cite: 5]
         self.pending_flip7_winner: Optional[Player] = None
+        # Highest total so far; ties go to the earlier seat, as with max()
+        self._leader: Optional[Player] = None
+        self._max_score = 0
+
+    def reset_for_new_game(self, seed: Optional[int] = None):
+        """Return to the pre-game state so the same players and deck can play again."""
+        self.rng.seed(seed)
+        self.deck.reset()
+        self.dealer_index = 0
+        self.round_num = 1
+        self.pending_flip7_winner = None
+        self._leader = None
+        self._max_score = 0
+        for p in self.players:
+            p.total_game_score = 0
+            p.reset_round()
 
     def _log(self, message: str):
-        if self.verbose:
-            print(message)
+        # Call sites check self.verbose first so quiet games never format messages
+        print(message)
 
-    def _select_action_target(self, drawer: Player, targets: List[Player], card: Card):
-        available_targets = [t for t in targets if t.active]
-        if not available_targets:
+    def _select_action_target(self, drawer: Player, card: int):
+        if not self._active_mask:
             return drawer
 
         if isinstance(drawer.strategy, HumanStrategy):
-            print(f"\nYou drew {card.name}. Choose a target:")
+            available_targets = [self.players[i] for i in _iter_bits(self._active_mask)]
+            print(f"\nYou drew {CARD_NAME[card]}. Choose a target:")
             for idx, target in enumerate(available_targets, start=1):
                 status = []
                 if target == drawer:
@@ -184,86 +327,110 @@ class Game:
                     return available_targets[int(choice) - 1]
                 print("Please enter a valid target number.")
 
-        non_self_targets = [t for t in available_targets if t != drawer]
-        if non_self_targets:
-            return random.choice(non_self_targets)
-        return available_targets[0]
+        # Pick uniformly among the other active players, falling back to the drawer
+        others = self._active_mask & ~(1 << drawer.idx)
+        if not others:
+            return drawer
+        for _ in range(self.rng.randrange(others.bit_count())):
+            others &= others - 1
+        return self.players[(others & -others).bit_length() - 1]
 
     def play_game(self):
-        self._log(f"Starting Flip 7! Goal: {self.winning_score} points.\n")
+        if self.verbose:
+            self._log(f"Starting Flip 7! Goal: {self.winning_score} points.\n")
 
-        while all(p.total_game_score < self.winning_score for p in self.players):
+        # _max_score is kept current by play_round, so no per-round scan is needed
+        while self._max_score < self.winning_score:
             self.play_round()
             self.round_num += 1
 
-            # Check for winner [cite: 188]
-            leaders = sorted(self.players, key=lambda x: x.total_game_score, reverse=True)
-            if leaders[0].total_game_score >= self.winning_score:
-                self._log(
-                    f"\nGame Over! {leaders[0].name} wins with {leaders[0].total_game_score} points!"
-                )
-                return {"winner": leaders[0], "rounds": self.round_num - 1, "players": self.players}
-                
+        # Check for winner [cite: 188]
+        # No round is played when the target is already met; like max(), fall back to the first seat
+        leader = self._leader or self.players[0]
+        if self.verbose:
+            self._log(
+                f"\nGame Over! {leader.name} wins with {leader.total_game_score} points!"
+            )
+        return {"winner": leader, "rounds": self.round_num - 1, "players": self.players}
+
     def get_active_players(self):
-        return [p for p in self.players if p.active]
+        return [self.players[i] for i in _iter_bits(self._active_mask)]
 
     def resolve_action_card(
         self,
         card,
         drawer,
-        players,
         *,
-        add_to_drawer_hand: bool = True,
         chosen_target: Optional["Player"] = None,
     ):
+        # Each handler places the card exactly once (a hand or the discard pile)
+        return self._ACTION_HANDLERS[card](self, card, drawer, chosen_target)
+
+    def _resolve_freeze(self, card, drawer, chosen_target):
         # [cite: 86] Action cards target active players
-        targets = [p for p in players if p.active]
-        target = chosen_target or self._select_action_target(drawer, targets, card)
-
-        if card.name == "Freeze":
-            # [cite: 93] Target banks points and is out
-            target.frozen = True
-            target.active = False
-            target.hand.append(card)
+        target = chosen_target or self._select_action_target(drawer, card)
+        # [cite: 93] Target banks points and is out
+        target.frozen = True
+        target.set_active(False)
+        target.hand.append(card)
+        if self.verbose:
             self._log(f"  > {target.name} is Frozen! They bank their current score and exit the round.")
+        return "OK"
 
-        elif card.name == "Flip Three":
-            # [cite: 95] Target must accept next 3 cards
+    def _resolve_flip_three(self, card, drawer, chosen_target):
+        target = chosen_target or self._select_action_target(drawer, card)
+        # [cite: 95] Target must accept next 3 cards
+        if self.verbose:
             self._log(f"  > {target.name} must Flip Three cards immediately!")
-            result = self.perform_flip_three(target)
-            self.deck.discard_pile.append(card)
-            if result == "FLIP7":
-                return "FLIP7"
+        result = self.perform_flip_three(target)
+        self.deck.discard_pile.append(card)
+        if result == "FLIP7":
+            return "FLIP7"
+        return "OK"
 
-        elif card.name == "Second Chance":
-            # [cite: 104] Keep this card. Protects against bust.
-            # Max 1 per player [cite: 105]
-            if not drawer.second_chance:
-                drawer.second_chance = True
-                drawer.hand.append(card)
+    def _resolve_second_chance(self, card, drawer, chosen_target):
+        # [cite: 104] Keep this card. Protects against bust.
+        # Max 1 per player [cite: 105]
+        if not drawer.second_chance:
+            drawer.second_chance = True
+            drawer.second_chance_idx = len(drawer.hand)
+            drawer.hand.append(card)
+            if self.verbose:
                 self._log(f"  > {drawer.name} gains a Second Chance!")
-            else:
-                recipient = next((p for p in players if p != drawer and not p.second_chance), None)
-                if recipient:
-                    recipient.second_chance = True
-                    recipient.hand.append(card)
-                    self._log(
-                        f"  > {drawer.name} already has one. Passed Second Chance to {recipient.name}."
-                    )
-                else:
-                    self.deck.discard_pile.append(card)
-                    self._log("  > No one can take Second Chance. Card discarded.")
-                return
+            return "OK"
 
-        if add_to_drawer_hand:
-            drawer.hand.append(card)
+        # Pass it to another active player [cite: 105]
+        others = self._active_mask & ~(1 << drawer.idx)
+        recipient = next(
+            (self.players[i] for i in _iter_bits(others) if not self.players[i].second_chance),
+            None,
+        )
+        if recipient:
+            recipient.second_chance = True
+            recipient.second_chance_idx = len(recipient.hand)
+            recipient.hand.append(card)
+            if self.verbose:
+                self._log(
+                    f"  > {drawer.name} already has one. Passed Second Chance to {recipient.name}."
+                )
+        else:
+            self.deck.discard_pile.append(card)
+            if self.verbose:
+                self._log("  > No one can take Second Chance. Card discarded.")
+        return None
 
-        return "OK"
+    # Action card id -> resolver, so dispatch is one dict lookup
+    _ACTION_HANDLERS = {
+        **dict.fromkeys(FREEZE_IDS, _resolve_freeze),
+        **dict.fromkeys(FLIP_THREE_IDS, _resolve_flip_three),
+        **dict.fromkeys(SECOND_CHANCE_IDS, _resolve_second_chance),
+    }
 
     def perform_flip_three(self, target: Player):
         flips_remaining = 3
         while flips_remaining > 0:
-            self._log(f"    {target.name} flips a card for Flip Three... ({flips_remaining} to go)")
+            if self.verbose:
+                self._log(f"    {target.name} flips a card for Flip Three... ({flips_remaining} to go)")
             result = self.deal_card_to_player(target, during_forced=True)
             flips_remaining -= 1
 
@@ -271,11 +438,12 @@ class Game:
                 return "FLIP7"
             if target.busted:
                 self.deck.discard_pile.extend([c for c, _ in target.pending_actions])
-                target.pending_actions = []
+                target.pending_actions.clear()
                 return "BUST"
 
         if target.pending_actions:
-            self._log(f"{target.name} finished Flip Three draws. Resolving pending actions...")
+            if self.verbose:
+                self._log(f"{target.name} finished Flip Three draws. Resolving pending actions...")
             result = self.resolve_pending_actions(target)
             if result == "FLIP7":
                 return "FLIP7"
@@ -284,101 +452,111 @@ class Game:
 
     def deal_card_to_player(self, player, *, during_forced: bool = False):
         card = self.deck.draw()
-        self._log(f"    {player.name} drew: {card}")
-
-        if card.card_type == CardType.ACTION:
-            # Action cards are resolved immediately (unless dealt during setup, handled separately)
-            # In regular play, they are placed above rows[cite: 88], but effect triggers
-            target_choice = None
-            if card.name in {"Flip Three", "Freeze"}:
-                target_choice = self._select_action_target(
-                    player, [p for p in self.players if p.active], card
-                )
-
-            if during_forced and card.name in {"Flip Three", "Freeze"}:
-                player.pending_actions.append((card, target_choice))
-                self._log(f"    ! {card.name} will resolve after the Flip Three sequence.")
-                return "OK"
-            else:
-                result = self.resolve_action_card(
-                    card,
-                    player,
-                    self.players,
-                    add_to_drawer_hand=False,
-                    chosen_target=target_choice,
-                )
-                if result == "FLIP7":
-                    self.pending_flip7_winner = self.pending_flip7_winner or player
-                    return "FLIP7"
-                return result
-
-        elif card.card_type == CardType.MODIFIER:
-            # [cite: 112] Modifiers don't cause bust
-            player.hand.append(card)
+        if self.verbose:
+            self._log(f"    {player.name} drew: {card_repr(card)}")
 
-        elif card.card_type == CardType.NUMBER:
+        # Number cards make up most of the deck, so they are checked first
+        card_type = CARD_TYPE[card]
+        if card_type == NUMBER:
             # Check for Bust [cite: 10]
-            existing_nums = [c.value for c in player.hand if c.card_type == CardType.NUMBER]
+            value = CARD_VALUE[card]
+            bit = 1 << value
 
-            if card.value in existing_nums:
+            if player.number_mask & bit:
                 if player.second_chance:
                     # [cite: 104] Discard duplicate and Second Chance
-                    self._log(
-                        f"    ! SAVED BY SECOND CHANCE ! Discarding {card} and Second Chance token."
-                    )
+                    if self.verbose:
+                        self._log(
+                            f"    ! SAVED BY SECOND CHANCE ! Discarding {card_repr(card)} and Second Chance token."
+                        )
                     player.second_chance = False
-                    for existing in list(player.hand):
-                        if existing.name == "Second Chance":
-                            player.hand.remove(existing)
-                            self.deck.discard_pile.append(existing)
-                            self.deck.discard_pile.append(card)
-                            break
+                    # Hands only grow until the card is consumed, so the stored index is still valid
+                    self.deck.discard_pile.append(player.hand.pop(player.second_chance_idx))
+                    self.deck.discard_pile.append(card)
                     # Card is effectively discarded, not added to hand
                 else:
-                    self._log(f"    ! BUST ! {player.name} drew a duplicate {card.value}.")
+                    if self.verbose:
+                        self._log(f"    ! BUST ! {player.name} drew a duplicate {value}.")
                     player.busted = True
-                    player.active = False
+                    player.set_active(False)
                     self.deck.discard_pile.extend([c for c, _ in player.pending_actions])
-                    player.pending_actions = []
+                    player.pending_actions.clear()
                     self.deck.discard_pile.append(card)
             else:
                 player.hand.append(card)
+                player.number_mask |= bit
+                player.number_sum += value
+                player.unique_count += 1
                 # Check Flip 7 Victory [cite: 9]
-                if player.has_flip_seven():
+                if player.unique_count >= 7:
                     self.pending_flip7_winner = player
                     return "FLIP7"
 
+        elif card_type == MODIFIER:
+            # [cite: 112] Modifiers don't cause bust
+            player.hand.append(card)
+            if card == X2_ID:
+                player.has_multiplier = True
+            else:
+                player.modifier_sum += CARD_VALUE[card]
+
+        else: # ACTION
+            # Action cards are resolved immediately (unless dealt during setup, handled separately)
+            # In regular play, they are placed above rows[cite: 88], but effect triggers
+            target_choice = None
+            if card in _TARGETED_ACTION_IDS:
+                target_choice = self._select_action_target(player, card)
+
+            if during_forced and card in _TARGETED_ACTION_IDS:
+                player.pending_actions.append((card, target_choice))
+                if self.verbose:
+                    self._log(f"    ! {CARD_NAME[card]} will resolve after the Flip Three sequence.")
+                return "OK"
+            else:
+                result = self.resolve_action_card(
+                    card,
+                    player,
+                    chosen_target=target_choice,
+                )
+                if result == "FLIP7":
+                    if self.pending_flip7_winner is None:
+                        self.pending_flip7_winner = player
+                    return "FLIP7"
+                return result
+
         return "OK"
 
     def resolve_pending_actions(self, player):
         if not player.pending_actions:
             return
 
+        pending = player.pending_actions
         if player.busted:
-            self.deck.discard_pile.extend([c for c, _ in player.pending_actions])
-            player.pending_actions = []
+            self.deck.discard_pile.extend([c for c, _ in pending])
+            pending.clear()
             return
 
-        pending = player.pending_actions[:]
-        player.pending_actions = []
-
-        for card, target in pending:
-            self._log(f"    > Resolving pending {card.name} from Flip Three.")
+        # Drain in place; a nested Flip Three may queue more actions behind these
+        while pending:
+            card, target = pending.popleft()
+            if self.verbose:
+                self._log(f"    > Resolving pending {CARD_NAME[card]} from Flip Three.")
             result = self.resolve_action_card(
                 card,
                 player,
-                self.players,
-                add_to_drawer_hand=False,
                 chosen_target=target,
             )
             if result == "FLIP7":
+                # Only the unresolved actions are left to discard
                 self.deck.discard_pile.extend([c for c, _ in pending])
+                pending.clear()
                 return "FLIP7"
 
         return "OK"
 
     def play_round(self):
-        self._log(f"\n--- Round {self.round_num} ---")
+        if self.verbose:
+            self._log(f"\n--- Round {self.round_num} ---")
         self.pending_flip7_winner = None
         for p in self.players:
             p.reset_round()
@@ -388,18 +566,22 @@ class Game:
 
         # Turns (starting from dealer)
         if not round_over:
-            turn_order = [
-                self.players[(self.dealer_index + i) % len(self.players)]
-                for i in range(len(self.players))
-            ]
+            # Per-seat values that stay fixed for the round are looked up once here
+            turn_order = []
+            for i in range(len(self.players)):
+                p = self.players[(self.dealer_index + i) % len(self.players)]
+                strategy = p.strategy
+                # Bind choose_action once; forced flips are handled below, so decide_action's check is redundant
+                turn_order.append((p, p.idx, getattr(strategy, "needs_opponents", True), strategy.choose_action))
+            verbose = self.verbose
+            deal_card_to_player = self.deal_card_to_player
 
             while not round_over:
-                active_players = [p for p in turn_order if p.active]
-                if not active_players:
+                if not self._active_mask:
                     break # Everyone stayed or busted [cite: 127]
 
-                for player in active_players:
-                    if not player.active: continue # Might have been frozen by previous player this loop
+                for player, idx, needs_opponents, choose_action in turn_order:
+                    if not (self._active_mask >> idx) & 1: continue # Stayed, busted, or frozen earlier
 
                     # Check forced flips (Flip Three)
                     action = "stay"
@@ -408,36 +590,46 @@ class Game:
                         action = "hit"
                         player.forced_flips -= 1
                         forced_draw = True
-                        self._log(f"{player.name} {player.hand} is forced to hit! ({player.forced_flips} remaining)")
+                        if verbose:
+                            self._log(f"{player.name} {format_cards(player.hand)} is forced to hit! ({player.forced_flips} remaining)")
                     else:
-                        opponents = [p for p in active_players if p != player]
-                        action = player.decide_action(opponents)
+                        # Most strategies ignore opponents, so only build the list on request
+                        opponents = ()
+                        if needs_opponents:
+                            others = self._active_mask & ~(1 << idx)
+                            opponents = [self.players[i] for i in _iter_bits(others)]
+                        action = choose_action(player, opponents)
 
                     if action == "hit":
-                        self._log(f"{player.name} {player.hand} HITS.")
-                        result = self.deal_card_to_player(player, during_forced=forced_draw)
+                        if verbose:
+                            self._log(f"{player.name} {format_cards(player.hand)} HITS.")
+                        result = deal_card_to_player(player, during_forced=forced_draw)
 
                         if forced_draw and player.forced_flips == 0 and not player.busted and result != "FLIP7":
-                            self._log(f"{player.name} finished Flip Three draws. Resolving pending actions...")
+                            if verbose:
+                                self._log(f"{player.name} finished Flip Three draws. Resolving pending actions...")
                             self.resolve_pending_actions(player)
 
                         if result == "FLIP7":
                             # [cite: 135] Round ends immediately
-                            self._log(f"!!! {player.name} ACHIEVED FLIP 7 !!!")
+                            if verbose:
+                                self._log(f"!!! {player.name} ACHIEVED FLIP 7 !!!")
                             winner_flip7 = self.pending_flip7_winner or player
                             round_over = True
                             for p in self.players:
                                 self.deck.discard_pile.extend([c for c, _ in p.pending_actions])
                             break
                     else:
-                        self._log(f"{player.name} {player.hand} STAYS.")
-                        player.active = False # Safe for round
+                        if verbose:
+                            self._log(f"{player.name} {format_cards(player.hand)} STAYS.")
+                        player.set_active(False) # Safe for round
 
         # 3. End of Round Scoring
-        self._log("\n--- Round Scores ---")
+        if self.verbose:
+            self._log("\n--- Round Scores ---")
 
         # [cite: 183] Discard all cards at end of round
-        current_round_cards = []
+        discard_pile = self.deck.discard_pile
 
         for p in self.players:
             score = p.calculate_round_score()
@@ -454,21 +646,19 @@ class Game:
                 pass
 
             p.total_game_score += score
-            self._log(f"{p.name}: +{score} (Total: {p.total_game_score}) | Hand: {p.hand}")
-
-            # Collect cards for discard
-            current_round_cards.extend(p.hand)
-
-        self.deck.discard_pile.extend(current_round_cards)
-        #TODO Sometimes, we get duplicated Flip Three cards in discard pile becasue of bad logic; this is a hacky way to fix that
-        if len(self.deck.discard_pile)+len(self.deck.draw_pile) != 94:
-            f3count = 0
-            for i, dc in enumerate(self.deck.discard_pile):
-                if dc.name == "Flip Three":
-                    f3count += 1
-                    if f3count > 3:
-                        self.deck.discard_pile.remove(dc)
-
+            total = p.total_game_score
+            if (
+                self._leader is None
+                or total > self._max_score
+                or (total == self._max_score and p.idx < self._leader.idx)
+            ):
+                self._leader = p
+                self._max_score = total
+            if self.verbose:
+                self._log(f"{p.name}: +{score} (Total: {p.total_game_score}) | Hand: {format_cards(p.hand)}")
+
+            # Collect cards for discard; reset_round clears the hand for reuse
+            discard_pile.extend(p.hand)
 
         # Rotate Dealer [cite: 184]
         self.dealer_index = (self.dealer_index + 1) % len(self.players)
@@ -481,38 +671,139 @@ def _strategy_label(strategy: Strategy) -> str:
     return strategy.__class__.__name__
 
 
-def run_simulations(
-    num_games: int, player_specs: List[Tuple[str, Strategy]], winning_score: int = 200
-):
-    """Run multiple games quietly and aggregate metrics by strategy label."""
+def _play_one(game: Game, seed: int):
+    """Replay ``game`` from scratch and return (winner seat, final scores, rounds)."""
 
-    summary: Dict[str, Dict[str, float]] = {}
+    game.reset_for_new_game(seed)
+    result = game.play_game()
+    return result["winner"].idx, [p.total_game_score for p in game.players], result["rounds"]
 
-    for _ in range(num_games):
-        names = [name for name, _ in player_specs]
-        strategies = [strategy for _, strategy in player_specs]
-        game = Game(names, strategies=strategies, verbose=False)
-        game.winning_score = winning_score
-        result = game.play_game()
-        rounds_played = result.get("rounds", game.round_num - 1) if result else game.round_num - 1
 
-        winners = sorted(game.players, key=lambda p: p.total_game_score, reverse=True)
-        winning_label = _strategy_label(winners[0].strategy)
+def _encode_strategy(strategy: Strategy):
+    """Return a compact (strategy_id, param) pair for built-in strategies.
 
-        for player in game.players:
-            label = _strategy_label(player.strategy)
-            summary.setdefault(label, {"wins": 0, "games": 0, "total_score": 0, "total_rounds": 0})
-            summary[label]["games"] += 1
-            summary[label]["total_score"] += player.total_game_score
-            summary[label]["total_rounds"] += rounds_played
+    Other strategies are returned unchanged and get pickled as they are.
+    """
 
-        summary[winning_label]["wins"] += 1
+    kind = type(strategy)
+    if kind is AggressiveStrategy:
+        return 0, 0
+    if kind is ConservativeStrategy:
+        return 1, strategy.stay_threshold
+    if kind is Flip7ChaserStrategy:
+        return 2, strategy.safe_score
+    if kind is PerfectStrategy:
+        return 3, 0
+    return strategy
+
+
+def _decode_strategy(encoded) -> Strategy:
+    if not isinstance(encoded, tuple):
+        return encoded
+
+    strategy_id, param = encoded
+    if strategy_id == 0:
+        return AGGRESSIVE
+    if strategy_id == 1:
+        return ConservativeStrategy(stay_threshold=param)
+    if strategy_id == 2:
+        return Flip7ChaserStrategy(safe_score=param)
+    return PERFECT
+
+
+def _play_batch(
+    encoded_specs: List[Tuple[str, object]],
+    winning_score: int,
+    label_ids: List[int],
+    num_labels: int,
+    seeds: List[int],
+):
+    """Play one game per seed and return [wins, games, total_score, total_rounds] per label id.
+
+    Reducing inside the worker means only a few small lists per batch cross
+    the process boundary, rather than one result per game.
+    """
+
+    names = [name for name, _ in encoded_specs]
+    strategies = [_decode_strategy(encoded) for _, encoded in encoded_specs]
+    # One game object is reset between seeds instead of rebuilding players and deck
+    game = Game(names, strategies=strategies, verbose=False)
+    game.winning_score = winning_score
+
+    wins = [0] * num_labels
+    games = [0] * num_labels
+    total_score = [0] * num_labels
+    total_rounds = [0] * num_labels
+    for seed in seeds:
+        winner, scores, rounds_played = _play_one(game, seed)
+        for label_id, score in zip(label_ids, scores):
+            games[label_id] += 1
+            total_score[label_id] += score
+            total_rounds[label_id] += rounds_played
+        wins[label_ids[winner]] += 1
+    return wins, games, total_score, total_rounds
 
-    for label, metrics in summary.items():
-        games = metrics["games"] or 1
-        metrics["win_rate"] = metrics["wins"] / games
-        metrics["avg_score"] = metrics["total_score"] / games
-        metrics["avg_rounds"] = metrics["total_rounds"] / games
+
+def run_simulations(
+    num_games: int,
+    player_specs: List[Tuple[str, Strategy]],
+    winning_score: int = 200,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+):
+    """Run multiple games quietly and aggregate metrics by strategy label.
+
+    Games are independent, so they are split into batches spread across
+    ``workers`` processes (defaults to the CPU count). Each game gets its own
+    seed derived from ``seed``, which makes a run reproducible regardless of
+    the worker count.
+    """
+
+    # Labels are fixed for the whole run, so metrics are accumulated by label id
+    labels: List[str] = []
+    label_ids = []
+    for _, strategy in player_specs:
+        label = _strategy_label(strategy)
+        if label not in labels:
+            labels.append(label)
+        label_ids.append(labels.index(label))
+
+    if seed is None:
+        seed = random.randrange(2**32)
+    seeds = [hash((seed, i)) & 0xFFFFFFFF for i in range(num_games)]
+
+    workers = workers or os.cpu_count() or 1
+    if any(isinstance(strategy, HumanStrategy) for _, strategy in player_specs):
+        workers = 1  # Prompts need the parent's stdin
+
+    encoded_specs = [(name, _encode_strategy(strategy)) for name, strategy in player_specs]
+    play_batch = partial(_play_batch, encoded_specs, winning_score, label_ids, len(labels))
+    if workers > 1 and num_games > 1:
+        # A few batches per worker keeps the load balanced when game lengths vary
+        batch_size = max(1, -(-num_games // (workers * 4)))
+        batches = [seeds[i : i + batch_size] for i in range(0, num_games, batch_size)]
+        # Totals are order-independent, so take batches as soon as any worker finishes
+        with Pool(processes=workers) as pool:
+            partials = list(pool.imap_unordered(play_batch, batches))
+    else:
+        partials = [play_batch(seeds)]
+
+    wins, games, total_score, total_rounds = (
+        [sum(column) for column in zip(*metric)] for metric in zip(*partials)
+    )
+
+    summary: Dict[str, Dict[str, float]] = {}
+    for label_id, label in enumerate(labels):
+        played = games[label_id] or 1
+        summary[label] = {
+            "wins": wins[label_id],
+            "games": games[label_id],
+            "total_score": total_score[label_id],
+            "total_rounds": total_rounds[label_id],
+            "win_rate": wins[label_id] / played,
+            "avg_score": total_score[label_id] / played,
+            "avg_rounds": total_rounds[label_id] / played,
+        }
 
     return summary
 
@@ -522,7 +813,7 @@ def _parse_strategy(spec: str) -> Strategy:
     base, _, param = spec.partition("=")
 
     if base in {"aggressive", "agg"}:
-        return AggressiveStrategy()
+        return AGGRESSIVE
     if base in {"human", "player"}:
         return HumanStrategy()
     if base in {"conservative", "cons"}:
@@ -532,7 +823,7 @@ def _parse_strategy(spec: str) -> Strategy:
         safe = int(param) if param else 50
         return Flip7ChaserStrategy(safe_score=safe)
     if base in {"perfect", "perf"}:
-        return PerfectStrategy()
+        return PERFECT
 
     raise ValueError(f"Unknown strategy spec: {spec}")
 
@@ -542,12 +833,12 @@ def _parse_player_specs(args_players: Optional[List[str]]) -> List[Tuple[str, St
         return [
             ("Alice", Flip7ChaserStrategy()),
             ("Bob", ConservativeStrategy(stay_threshold=35)),
-            ("Charlie", AggressiveStrategy()),
+            ("Charlie", AGGRESSIVE),
             ("Diana", Flip7ChaserStrategy(safe_score=45)),
             ("Eugene", ConservativeStrategy(stay_threshold=30)),
             ("Frank", ConservativeStrategy(stay_threshold=27)),
-            ("Georgina", AggressiveStrategy()),
-            ("Pat", PerfectStrategy()),
+            ("Georgina", AGGRESSIVE),
+            ("Pat", PERFECT),
         ]
 
     parsed = []
@@ -582,6 +873,16 @@ def main():
         default=200,
         help="Target score to win the game",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for reproducible games and simulations",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for simulations (defaults to the CPU count)",
+    )
     parser.add_argument(
         "--simulate",
         action="store_true",
@@ -592,12 +893,18 @@ def main():
     player_specs = _parse_player_specs(args.players)
 
     if args.simulate or args.games > 1:
-        summary = run_simulations(args.games, player_specs, winning_score=args.winning_score)
+        summary = run_simulations(
+            args.games,
+            player_specs,
+            winning_score=args.winning_score,
+            workers=args.workers,
+            seed=args.seed,
+        )
         _print_summary(summary)
     else:
         names = [name for name, _ in player_specs]
         strategies = [strategy for _, strategy in player_specs]
-        game = Game(names, strategies=strategies)
+        game = Game(names, strategies=strategies, seed=args.seed)
         game.winning_score = args.winning_score
         game.play_game()
 
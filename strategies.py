@@ -1,15 +1,32 @@
 from __future__ import annotations
 
 from typing import Protocol, TYPE_CHECKING
-from enum import Enum, auto
 
 if TYPE_CHECKING:  # pragma: no cover
     from typing import Iterable
     from flip7 import Player
 
+# flip7 imports this module, so its card tables are bound by _bind_card_tables() on first use
+CARD_TYPE = CARD_VALUE = FACE_CARD = MODIFIER = NUMBER = X2_ID = score_hand = None
+
+
+def _bind_card_tables() -> None:
+    global CARD_TYPE, CARD_VALUE, FACE_CARD, MODIFIER, NUMBER, X2_ID, score_hand
+    from flip7 import CARD_TYPE, CARD_VALUE, FACE_CARD, MODIFIER, NUMBER, X2_ID, score_hand
+
 
 class Strategy(Protocol):
-    """Protocol for player decision logic."""
+    """Protocol for player decision logic.
+
+    Strategies that read ``active_opponents`` set ``needs_opponents = True``;
+    the game passes an empty tuple to the rest. Strategies without the
+    attribute are treated as needing opponents.
+
+    Strategies should keep no per-player state, so one instance can be
+    shared by several players.
+    """
+
+    needs_opponents: bool
 
     def choose_action(self, player: "Player", active_opponents: "Iterable[Player]") -> str:
         """Return "hit" or "stay" for the given player."""
@@ -19,6 +36,8 @@ class Strategy(Protocol):
 class AggressiveStrategy:
     """Always hit, regardless of score or opponents."""
 
+    needs_opponents = False
+
     def choose_action(self, player, active_opponents):
         return "hit"
 
@@ -26,14 +45,19 @@ class AggressiveStrategy:
 class HumanStrategy:
     """Interactive strategy that prompts a human for each decision."""
 
+    needs_opponents = False
+
     def choose_action(self, player, active_opponents):
         if player.forced_flips > 0:
             return "hit"
 
+        # Local import to avoid circular dependency at module load time
+        from flip7 import format_cards
+
         current_score = player.calculate_round_score()
         prompt = (
             f"\n{player.name}, it's your turn.\n"
-            f"Current hand: {player.hand}\n"
+            f"Current hand: {format_cards(player.hand)}\n"
             f"Current round score: {current_score}\n"
             "Choose action ([h]it/[s]tay): "
         )
@@ -50,6 +74,8 @@ class HumanStrategy:
 class ConservativeStrategy:
     """Stay once the player reaches a configurable score threshold."""
 
+    needs_opponents = False
+
     def __init__(self, stay_threshold: int = 40):
         self.stay_threshold = stay_threshold
 
@@ -66,91 +92,113 @@ class ConservativeStrategy:
 class Flip7ChaserStrategy:
     """Keep drawing to chase Flip 7 unless the score is already comfortable."""
 
+    needs_opponents = False
+
     def __init__(self, safe_score: int = 50):
         self.safe_score = safe_score
 
-    @staticmethod
-    def _unique_number_count(player) -> int:
-        return len({c.value for c in player.hand if getattr(c.card_type, "name", None) == "NUMBER"})
-
     def choose_action(self, player, active_opponents):
         if player.forced_flips > 0:
             return "hit"
 
-        unique_numbers = self._unique_number_count(player)
-        current_score = player.calculate_round_score()
+        return _flip7_chaser_decision(player.unique_count, player.calculate_round_score(), self.safe_score)
 
-        if player.has_flip_seven():
-            return "stay"
 
-        if unique_numbers >= 5:
-            return "hit"
+def _flip7_chaser_decision(unique_count: int, round_score: int, safe_score: int) -> str:
+    """Flip7ChaserStrategy's rule as a pure function of the player's round state."""
 
-        if current_score >= self.safe_score:
-            return "stay"
+    if unique_count >= 7:
+        return "stay"
 
+    if unique_count >= 5:
         return "hit"
 
+    if round_score >= safe_score:
+        return "stay"
+
+    return "hit"
+
 
 class PerfectStrategy:
     """Card-counting strategy that maximizes expected value each turn."""
 
+    needs_opponents = False
+
     @staticmethod
     def _simulate_score_after_hit(player, card):
-        # Local import to avoid circular dependency at module load time
-        from flip7 import CardType, Player
-
-        temp_player = Player(player.name)
-        temp_player.hand = list(player.hand)
-        temp_player.busted = False
-        temp_player.second_chance = player.second_chance
-
-        if getattr(card.card_type, "name", None) == "NUMBER":
-            existing_nums = [
-                c.value for c in temp_player.hand if getattr(c.card_type, "name", None) == "NUMBER"
-            ]
-            if card.value in existing_nums:
-                if temp_player.second_chance:
-                    temp_player.second_chance = False
-                else:
-                    temp_player.busted = True
+        # choose_action binds the card tables before scoring any face
+
+        # Work on the player's running totals; no scratch hand is needed
+        number_sum = player.number_sum
+        modifier_sum = player.modifier_sum
+        has_multiplier = player.has_multiplier
+        unique_count = player.unique_count
+
+        card_type = CARD_TYPE[card]
+        if card_type == NUMBER:
+            value = CARD_VALUE[card]
+            if player.number_mask >> value & 1:
+                if not player.second_chance:
                     return 0
+                # Second Chance absorbs the duplicate; the hand is unchanged
             else:
-                temp_player.hand.append(card)
-        elif getattr(card.card_type, "name", None) == "ACTION":
-            temp_player.hand.append(card)
-            if card.name == "Second Chance" and not temp_player.second_chance:
-                temp_player.second_chance = True
-        else:
-            temp_player.hand.append(card)
+                number_sum += value
+                unique_count += 1
+        elif card_type == MODIFIER:
+            if card == X2_ID:
+                has_multiplier = True
+            else:
+                modifier_sum += CARD_VALUE[card]
+        # Action cards do not change the score
 
-        return temp_player.calculate_round_score()
+        return score_hand(number_sum, modifier_sum, has_multiplier, unique_count)
 
     def choose_action(self, player, active_opponents):
+        if FACE_CARD is None:
+            _bind_card_tables()
+
+        if player.forced_flips > 0:
+            return "hit"
+
+        # Flip 7 ends the round, so there is nothing left to gain
+        if player.unique_count >= 7:
+            return "stay"
+
+        # Staying on an empty hand banks nothing and the first card cannot bust.
+        # Hitting here also keeps a table of card counters from staying forever.
+        if not player.hand:
+            return "hit"
+
         game = getattr(player, "game", None)
-        if not game or not game.deck.draw_pile:
+        if not game:
             return "stay"
 
+        # Once the draw pile is empty, the next hit draws from the reshuffled discard pile
         deck = game.deck
-        remaining_cards = deck.draw_pile
-        total_cards = len(remaining_cards)
+        total_cards = len(deck.next_draw_pile())
+        if not total_cards:
+            return "stay"
 
-        numbers_in_hand = {
-            c.value for c in player.hand if getattr(c.card_type, "name", None) == "NUMBER"
-        }
+        # Copies of a card score identically, so score each face once and weight by its count.
+        # The deck caches the tally until the next draw, so players deciding in a row share it.
+        numbers_in_hand = player.number_mask
+        bust_count = 0
+        expected_total = 0
+        for face, count in enumerate(deck.face_counts()):
+            if not count:
+                continue
+            card = FACE_CARD[face]
+            if CARD_TYPE[card] == NUMBER and numbers_in_hand >> CARD_VALUE[card] & 1:
+                bust_count += count
+            expected_total += count * self._simulate_score_after_hit(player, card)
 
         if player.second_chance:
             bust_probability = 0
         else:
-            bust_cards = [
-                c
-                for c in remaining_cards
-                if getattr(c.card_type, "name", None) == "NUMBER" and c.value in numbers_in_hand
-            ]
-            bust_probability = len(bust_cards) / total_cards
+            bust_probability = bust_count / total_cards
 
         current_score = player.calculate_round_score()
-        expected_score = sum(self._simulate_score_after_hit(player, card) for card in remaining_cards) / total_cards
+        expected_score = expected_total / total_cards
         #print("current score: ", current_score)
         #print("expected score: ", expected_score)
 
@@ -158,3 +206,8 @@ class PerfectStrategy:
             return "hit"
 
         return "stay"
+
+
+# Shared instances of the parameterless strategies
+AGGRESSIVE = AggressiveStrategy()
+PERFECT = PerfectStrategy()